@@ -12,6 +12,7 @@ void bind_application(py::module m) {
       .def_property("precision", &MnApplication::Precision,
                     &MnApplication::SetPrecision)
       .def_property_readonly("strategy", &MnApplication::Strategy)
+      .def("set_value", py::overload_cast<unsigned, double>(&MnApplication::SetValue))
 
       ;
 }
@@ -2,12 +2,25 @@
 #include <Minuit2/FCNBase.h>
 #include <Minuit2/FunctionMinimum.h>
 #include <Minuit2/MnContours.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <utility>
+#include <vector>
 
 namespace py = pybind11;
 using namespace ROOT::Minuit2;
 
+py::array_t<double> points_to_numpy(const std::vector<std::pair<double, double>>& v) {
+  py::array_t<double> a({static_cast<ssize_t>(v.size()), static_cast<ssize_t>(2)});
+  auto r = a.mutable_unchecked<2>();
+  for (ssize_t i = 0; i < r.shape(0); ++i) {
+    r(i, 0) = v[i].first;
+    r(i, 1) = v[i].second;
+  }
+  return a;
+}
+
 void bind_contours(py::module m) {
   py::class_<MnContours>(m, "MnContours")
 
@@ -15,7 +28,8 @@ void bind_contours(py::module m) {
       .def("__call__",
            [](const MnContours& self, unsigned ix, unsigned iy, unsigned npoints) {
              const auto ce = self.Contour(ix, iy, npoints);
-             return py::make_tuple(ce.XMinosError(), ce.YMinosError(), ce());
+             return py::make_tuple(ce.XMinosError(), ce.YMinosError(),
+                                   points_to_numpy(ce()));
            })
 
       ;
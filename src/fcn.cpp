@@ -5,6 +5,7 @@
 #include <pybind11/pybind11.h>
 #include <cmath>
 #include <cstdint>
+#include <cstring>
 #include <limits>
 #include <sstream>
 #include <vector>
@@ -21,21 +22,54 @@ FCN::FCN(py::object fcn, py::object grad, bool array_call, double errordef)
   if (address) {
     MnPrint("FCN").Debug("using cfunc");
     cfcn_ = reinterpret_cast<cfcn_t>(address);
-    array_call_ = true;
   }
 }
 
+// FNV-1a hash over the bit patterns of the values
+std::uint64_t hash_vector(const std::vector<double>& x) {
+  std::uint64_t h = 14695981039346656037ULL;
+  for (auto&& xi : x) {
+    std::uint64_t bits;
+    std::memcpy(&bits, &xi, sizeof(double));
+    h ^= bits;
+    h *= 1099511628211ULL;
+  }
+  return h;
+}
+
 double FCN::operator()(const std::vector<double>& x) const {
+  if (cfcn_) {
+    ++nfcn_;
+    return cfcn_(x.size(), x.data());
+  }
+
+  const auto h = hash_vector(x);
+  for (auto&& e : cache_)
+    if (e.hash == h && e.x == x) return e.fval;
+
   ++nfcn_;
+  double r;
   if (array_call_) {
-    if (cfcn_) {
-      return cfcn_(x.size(), x.data());
-    } else {
-      py::array_t<double> a(static_cast<ssize_t>(x.size()), x.data());
-      return check_value(py::cast<double>(fcn_(a)), x);
-    }
+    py::array_t<double> a(static_cast<ssize_t>(x.size()), x.data());
+    r = check_value(py::cast<double>(fcn_(a)), x);
+  } else {
+    r = check_value(py::cast<double>(fcn_(*py::cast(x))), x);
+  }
+
+  // enough room for the points of one numerical gradient computation
+  const auto capacity = 2 * x.size() + 1;
+  if (cache_.size() < capacity) {
+    cache_.push_back({h, x, r});
+  } else {
+    cache_[cache_next_] = {h, x, r};
+    cache_next_ = (cache_next_ + 1) % capacity;
   }
-  return check_value(py::cast<double>(fcn_(*py::cast(x))), x);
+  return r;
+}
+
+void FCN::clear_cache() const {
+  cache_.clear();
+  cache_next_ = 0;
 }
 
 std::vector<double> FCN::Gradient(const std::vector<double>& x) const {
@@ -120,7 +154,14 @@ void bind_fcn(py::module m) {
       .def_readonly("_fcn", &FCN::fcn_)
       .def_readonly("_grad", &FCN::grad_)
 
-      .def("__call__", &FCN::operator())
+      .def("_clear_cache", &FCN::clear_cache)
+
+      .def("__call__",
+           [](const FCN& self, const std::vector<double>& x) {
+             // calls from Python must not see stale values
+             self.clear_cache();
+             return self(x);
+           })
 
       .def(py::pickle(
           [](const FCN& self) {
@@ -1,5 +1,6 @@
 #include <Minuit2/FCNGradientBase.h>
 #include <pybind11/pytypes.h>
+#include <cstdint>
 #include <vector>
 
 namespace py = pybind11;
@@ -28,6 +29,8 @@ struct FCN : ROOT::Minuit2::FCNGradientBase {
 
   double ndata() const;
 
+  void clear_cache() const;
+
   py::object fcn_, grad_;
   bool array_call_;
   mutable double errordef_;
@@ -35,4 +38,19 @@ struct FCN : ROOT::Minuit2::FCNGradientBase {
   cfcn_t cfcn_ = nullptr;
   bool throw_nan_ = false;
   mutable unsigned nfcn_ = 0, ngrad_ = 0;
+
+  /*
+    Minuit2 sometimes evaluates the function repeatedly at identical points, for
+    example, the final Hesse step in Migrad repeats the last gradient computation. We
+    keep the most recent results in a small ring buffer to skip these calls. Minuit
+    clears the cache before an algorithm is started, because the user may change the
+    function in between (e.g. the data of a cost function).
+  */
+  struct CacheEntry {
+    std::uint64_t hash;
+    std::vector<double> x;
+    double fval;
+  };
+  mutable std::vector<CacheEntry> cache_;
+  mutable std::size_t cache_next_ = 0;
 };
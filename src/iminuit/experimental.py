@@ -7,7 +7,9 @@ warning.
 Use at your own risk.
 """
 
-from .util import merge_signatures
+from .util import merge_signatures, describe
+from functools import lru_cache
+import numpy as np
 
 
 def expanded(*callables):
@@ -36,3 +38,76 @@ def expanded(*callables):
         f"lambda {total} : funcs[{i}]({arg})" for (i, arg) in enumerate(args)
     )
     return eval(lambdas, {"funcs": callables})
+
+
+def parallel_sum(fcn, data, nchunks=None):
+    """
+    Return cost function which evaluates a Numba-compiled function in parallel.
+
+    The data is split into chunks of equal size, the function is called on each chunk
+    in parallel with ``numba.prange``, and the results are added. This requires that the
+    cost function is a sum over independent contributions from the data points, which
+    is true for least-squares and negative log-likelihood functions.
+
+    Example::
+
+        @numba.njit
+        def nll(x, mu, sigma):
+            return -np.sum(np.log(norm_pdf(x, mu, sigma)))
+
+        cost = parallel_sum(nll, x)  # equivalent to: def cost(mu, sigma): ...
+        cost.errordef = Minuit.LIKELIHOOD
+        m = Minuit(cost, mu=0, sigma=1)
+
+    Parallel execution only pays off if the data is large, the overhead of starting
+    the threads is large for small data sizes.
+
+    Parameters
+    ----------
+    fcn : callable
+        Numba-compiled function of the form f(data, par0, [par1, ...]), which computes
+        the cost for a chunk of data.
+    data : array-like
+        Data which is split into chunks along the first dimension.
+    nchunks : int, optional
+        Number of chunks, must be at least 1. If None (default), use the number of
+        threads which Numba is configured to use. At most one chunk per data point is
+        used.
+
+    Returns
+    -------
+    callable with the signature of `fcn` without the first argument.
+    """
+    import numba as nb
+
+    if nchunks is None:
+        nchunks = nb.get_num_threads()
+    elif nchunks < 1:
+        raise ValueError("nchunks must be at least 1")
+    data = np.asarray(data)
+    # more chunks than data points would pass empty chunks to fcn
+    nchunks = max(min(nchunks, len(data)), 1)
+    reduce = _chunked_reducer(fcn)
+    args = ",".join(describe(fcn)[1:])
+    return eval(
+        f"lambda {args}: reduce(data, nchunks, {args})",
+        {"reduce": reduce, "data": data, "nchunks": nchunks},
+    )
+
+
+@lru_cache(maxsize=8)
+def _chunked_reducer(fcn):
+    # compiled reducer is cached per function, since compilation takes much longer than
+    # a typical fit; the number of chunks is an argument, so that changing it does not
+    # trigger a recompilation; the cache is bounded, since it keeps fcn alive
+    import numba as nb
+
+    @nb.njit(parallel=True)
+    def reduce(x, nchunks, *args):
+        n = len(x)
+        r = np.empty(nchunks)
+        for i in nb.prange(nchunks):
+            r[i] = fcn(x[i * n // nchunks : (i + 1) * n // nchunks], *args)
+        return np.sum(r)
+
+    return reduce
@@ -1,6 +1,7 @@
 """Minuit class."""
 
 import warnings
+from functools import lru_cache
 from . import util as mutil
 from ._core import (
     FCN,
@@ -52,6 +53,7 @@ class Minuit:
         "_pos2var",
         "_init_state",
         "_last_state",
+        "_mncontour_cache",
     )
 
     LEAST_SQUARES = 1.0
@@ -252,11 +254,13 @@ class Minuit:
         --------
         errors, fixed, limits
         """
+        if self._values is None:
+            self._values = mutil.ValueView(self)
         return self._values
 
     @values.setter
     def values(self, args: Iterable) -> None:
-        self._values[:] = args
+        self.values[:] = args
 
     @property
     def errors(self) -> mutil.ErrorView:
@@ -269,11 +273,13 @@ class Minuit:
         --------
         values, fixed, limits
         """
+        if self._errors is None:
+            self._errors = mutil.ErrorView(self)
         return self._errors
 
     @errors.setter
     def errors(self, args: Iterable) -> None:
-        self._errors[:] = args
+        self.errors[:] = args
 
     @property
     def fixed(self) -> mutil.FixedView:
@@ -291,11 +297,13 @@ class Minuit:
         --------
         values, errors, limits
         """
+        if self._fixed is None:
+            self._fixed = mutil.FixedView(self)
         return self._fixed
 
     @fixed.setter
     def fixed(self, args: Iterable) -> None:
-        self._fixed[:] = args
+        self.fixed[:] = args
 
     @property
     def limits(self) -> mutil.LimitView:
@@ -316,11 +324,13 @@ class Minuit:
         --------
         values, errors, fixed
         """
+        if self._limits is None:
+            self._limits = mutil.LimitView(self)
         return self._limits
 
     @limits.setter
     def limits(self, args: Iterable) -> None:
-        self._limits[:] = args
+        self.limits[:] = args
 
     @property
     def merrors(self) -> mutil.MErrors:
@@ -334,6 +344,8 @@ class Minuit:
         util.MError
         util.MErrors
         """
+        if self._merrors is None:
+            self._merrors = mutil.MErrors()
         return self._merrors
 
     @property
@@ -420,7 +432,7 @@ class Minuit:
         --------
         init_params, util.Params
         """
-        return _get_params(self._last_state, self._merrors)
+        return _get_params(self._last_state, self.merrors)
 
     @property
     def init_params(self) -> mutil.Params:
@@ -475,6 +487,7 @@ class Minuit:
         *args: Union[float, mutil.Indexable[float]],
         grad: Optional[Callable] = None,
         name: Optional[Collection[str]] = None,
+        jit: bool = False,
         **kwds: float,
     ):
         """
@@ -497,6 +510,12 @@ class Minuit:
             If None (default), Minuit will calculate the gradient numerically.
         name :
             If it is set, it overrides iminuit's function signature detection.
+        jit :
+            If True, compile a wrapper around the cost function with Numba, which is
+            called by Minuit without going through the Python interpreter. This
+            requires that the cost function can be compiled by Numba; if that fails,
+            a warning is emitted and the function is called as usual. Default is
+            False.
         **kwds :
             Starting values for the minimization as keyword arguments.
             See notes for details on how to set starting values.
@@ -591,7 +610,7 @@ class Minuit:
         if name is None:
             name = mutil.describe(fcn)
             if len(name) == 0 or (array_call and len(name) == 1):
-                name = tuple(f"x{i}" for i in range(len(start)))
+                name = _default_names(len(start))
 
         if len(start) == 0 and len(kwds) == 0:
             raise RuntimeError(
@@ -602,22 +621,26 @@ class Minuit:
         # Maintain two dictionaries to easily convert between
         # parameter names and position
         self._pos2var = tuple(name)
-        self._var2pos = {k: i for i, k in enumerate(name)}
+        self._var2pos = {k: i for i, k in enumerate(self._pos2var)}
+
+        if mutil._address_of_cfunc(fcn) != 0:
+            # a cfunc receives the parameters as an array, so does its gradient
+            array_call = True
 
         self.tol = None  # set to default value
         self._strategy = MnStrategy(1)
         self._fcn = FCN(
-            fcn,
+            _make_cfunc(fcn, len(name), array_call) if jit else fcn,
             getattr(fcn, "grad", grad),
             array_call,
             getattr(fcn, "errordef", 0.0),
         )
 
         self._init_state = _make_init_state(self._pos2var, start, kwds)
-        self._values = mutil.ValueView(self)
-        self._errors = mutil.ErrorView(self)
-        self._fixed = mutil.FixedView(self)
-        self._limits = mutil.LimitView(self)
+        self._values: Optional[mutil.ValueView] = None
+        self._errors: Optional[mutil.ErrorView] = None
+        self._fixed: Optional[mutil.FixedView] = None
+        self._limits: Optional[mutil.LimitView] = None
 
         self.precision = getattr(fcn, "precision", None)
 
@@ -634,11 +657,19 @@ class Minuit:
         self._fmin: Optional[mutil.FMin] = None
         self._fcn._nfcn = 0
         self._fcn._ngrad = 0
-        self._merrors = mutil.MErrors()
+        self._merrors: Optional[mutil.MErrors] = None
         self._covariance: Optional[mutil.Matrix] = None
+        self._mncontour_cache: Optional[
+            Tuple[mutil.FMin, Dict[Tuple, np.ndarray]]
+        ] = None
         return self  # return self for method chaining and to autodisplay current state
 
-    def migrad(self, ncall: Optional[int] = None, iterate: int = 5) -> "Minuit":
+    def migrad(
+        self,
+        ncall: Optional[int] = None,
+        iterate: int = 5,
+        callback: Optional[Callable[[mutil.FMin], bool]] = None,
+    ) -> "Minuit":
         """
         Run Migrad minimization.
 
@@ -662,6 +693,11 @@ class Minuit:
             the numerical precision of the cost function is low. Setting this to 1
             disables the feature.
 
+        callback :
+            Function which is called with the :class:`iminuit.util.FMin` object of each
+            Migrad call (Default: None). If it returns True, no further calls are made.
+            Can be used to save intermediate results or to stop long fits early.
+
         See Also
         --------
         simplex, scan
@@ -672,28 +708,29 @@ class Minuit:
         if iterate < 1:
             raise ValueError("iterate must be at least 1")
 
+        self._fcn._clear_cache()
         migrad = MnMigrad(self._fcn, self._last_state, self.strategy)
+        precision = self._precision
 
         # Automatically call Migrad up to `iterate` times if minimum is not valid.
-        # This simple heuristic makes Migrad converge more often.
+        # This simple heuristic makes Migrad converge more often. MnMigrad is not
+        # rebuilt for a retry, since it keeps the state of the last call internally, so
+        # each retry is warm-started from the previous result.
         for _ in range(iterate):
             # workaround: precision must be set again after each call to MnMigrad
-            if self._precision is not None:
-                migrad.precision = self._precision
+            if precision is not None:
+                migrad.precision = precision
             fm = migrad(ncall, self._tolerance)
+            fmin = None
+            if callback is not None:
+                fmin = self._migrad_fmin(fm)
+                if callback(fmin):
+                    break
             if fm.is_valid or fm.has_reached_call_limit:
                 break
 
         self._last_state = fm.state
-
-        self._fmin = mutil.FMin(
-            fm,
-            "Migrad",
-            self.nfcn,
-            self.ngrad,
-            self.ndof,
-            self._edm_goal(migrad_factor=True),
-        )
+        self._fmin = self._migrad_fmin(fm) if fmin is None else fmin
         self._make_covariance()
 
         return self  # return self for method chaining and to autodisplay current state
@@ -735,6 +772,7 @@ class Minuit:
         if ncall is None:
             ncall = 0  # tells C++ Minuit to use its internal heuristic
 
+        self._fcn._clear_cache()
         simplex = MnSimplex(self._fcn, self._last_state, self.strategy)
         if self._precision is not None:
             simplex.precision = self._precision
@@ -746,7 +784,7 @@ class Minuit:
             fm, "Simplex", self.nfcn, self.ngrad, self.ndof, self._edm_goal()
         )
         self._covariance = None
-        self._merrors = mutil.MErrors()
+        self._merrors = None
 
         return self  # return self for method chaining and to autodisplay current state
 
@@ -804,7 +842,7 @@ class Minuit:
             ncall = self._migrad_maxcall()
         nstep = int(ncall ** (1 / n))
 
-        if self._last_state == self._init_state:
+        if self._last_state is self._init_state:
             # avoid overriding initial state
             self._last_state = MnUserParameterState(self._last_state)
 
@@ -841,11 +879,12 @@ class Minuit:
         run(0)
 
         edm_goal = self._edm_goal()
+        self._fcn._clear_cache()
         fm = FunctionMinimum(self._fcn, self._last_state, self.strategy, edm_goal)
         self._last_state = fm.state
         self._fmin = mutil.FMin(fm, "Scan", self.nfcn, self.ngrad, self.ndof, edm_goal)
         self._covariance = None
-        self._merrors = mutil.MErrors()
+        self._merrors = None
 
         return self  # return self for method chaining and to autodisplay current state
 
@@ -911,7 +950,7 @@ class Minuit:
             ncall = self._migrad_maxcall()
 
         cfree = ~np.array(self.fixed[:], dtype=bool)
-        cpar = np.array(self.values[:])
+        cpar = self._last_state.values  # fresh array, safe to modify
         no_fixed_parameters = self.nfit == self.npar
 
         if no_fixed_parameters:
@@ -1051,33 +1090,27 @@ class Minuit:
 
         # Limits for scipy need to be a little bit tighter than the ones for Minuit
         # so that the Jacobian of the transformation is not zero or infinite.
-        start = []
-        lower_bound = []
-        upper_bound = []
-        has_limits = False
-        for p in self.params:
-            if p.is_fixed:
-                continue
-            has_limits |= p.has_limits
-            # ensure lower < x < upper for Minuit
-            ai = -np.inf if p.lower_limit is None else p.lower_limit
-            bi = np.inf if p.upper_limit is None else p.upper_limit
-            if ai > 0:
-                ai *= 1 + pr.eps2
-            elif ai < 0:
-                ai *= 1 - pr.eps2
-            else:
-                ai = pr.eps2
-            if bi > 0:
-                bi *= 1 - pr.eps2
-            elif bi < 0:
-                bi *= 1 + pr.eps2
-            else:
-                bi = -pr.eps2
-            xi = np.clip(p.value, ai, bi)
-            lower_bound.append(ai)
-            upper_bound.append(bi)
-            start.append(xi)
+        free = [p for p in self.params if not p.is_fixed]
+        has_limits = any(p.has_limits for p in free)
+        start = np.array([p.value for p in free])
+        lower = np.array(
+            [-np.inf if p.lower_limit is None else p.lower_limit for p in free]
+        )
+        upper = np.array(
+            [np.inf if p.upper_limit is None else p.upper_limit for p in free]
+        )
+        # ensure lower < x < upper for Minuit
+        lower_bound = np.where(
+            lower > 0,
+            lower * (1 + pr.eps2),
+            np.where(lower < 0, lower * (1 - pr.eps2), pr.eps2),
+        )
+        upper_bound = np.where(
+            upper > 0,
+            upper * (1 - pr.eps2),
+            np.where(upper < 0, upper * (1 + pr.eps2), -pr.eps2),
+        )
+        start = np.clip(start, lower_bound, upper_bound)
 
         if method is None:
             # like in scipy.optimize.minimize
@@ -1251,6 +1284,8 @@ class Minuit:
             )
             return self
 
+        self._fcn._clear_cache()
+
         if self._fmin is None or self._fmin._src.state is not self._last_state:
             # _fmin does not exist or last_state was modified, create a seed minimum
             edm_goal = self._edm_goal(migrad_factor=True)
@@ -1268,7 +1303,7 @@ class Minuit:
                 self.ndof,
                 edm_goal,
             )
-            self._merrors = mutil.MErrors()
+            self._merrors = None
 
         fm = self._fmin._src
 
@@ -1350,14 +1385,17 @@ class Minuit:
         if not fm.is_valid:
             raise RuntimeError(f"Function minimum is not valid: {repr(self._fmin)}")
 
+        # query the fixed state of all parameters in one pass over the C++ state
+        free = self._free_parameters()
         if len(parameters) == 0:
-            pars = [par for par in self.parameters if not self.fixed[par]]
+            pars = free
         else:
+            free_set = frozenset(free)
             pars = []
             for par in parameters:
                 if par not in self._var2pos:
                     raise RuntimeError(f"Unknown parameter {par}")
-                if self.fixed[par]:
+                if par not in free_set:
                     warnings.warn(
                         f"Cannot scan over fixed parameter {par}",
                         mutil.IMinuitWarning,
@@ -1365,11 +1403,12 @@ class Minuit:
                 else:
                     pars.append(par)
 
+        self._fcn._clear_cache()
         with TemporaryErrordef(self._fcn, factor):
             minos = MnMinos(self._fcn, fm, self.strategy)
             for par in pars:
                 me = minos(self._var2pos[par], ncall, self._tolerance)
-                self._merrors[par] = mutil.MError(
+                self.merrors[par] = mutil.MError(
                     me.number,
                     par,
                     me.lower,
@@ -1400,12 +1439,14 @@ class Minuit:
         size: int = 30,
         bound: Union[float, mutil.UserBound] = 2,
         subtract_min: bool = False,
+        parallel: Optional[int] = None,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         r"""
         Get Minos profile over a specified interval.
 
         Scans over one parameter and minimises the function with respect to all other
-        parameters for each scan point.
+        parameters for each scan point. Unless `parallel` is set, each minimisation starts
+        from the minimum of the previous scan point.
 
         Parameters
         ----------
@@ -1419,6 +1460,13 @@ class Minuit:
             bound * :math:`\sigma`) (Default: 2).
         subtract_min :
             Subtract minimum from return values (Default: False).
+        parallel :
+            If set to a positive number, minimise the scan points in that many worker
+            processes, using :class:`concurrent.futures.ProcessPoolExecutor`. This
+            requires that the cost function can be pickled, so lambdas and local
+            functions cannot be used. In scripts, the call must be protected by
+            ``if __name__ == "__main__":``, since the workers import the main module
+            (Default: None).
 
         Returns
         -------
@@ -1432,25 +1480,37 @@ class Minuit:
         if vname not in self._pos2var:
             raise ValueError("Unknown parameter %s" % vname)
 
-        bound = self._normalize_bound(vname, bound)
-
-        x = np.linspace(bound[0], bound[1], size, dtype=np.double)
+        x = self._scan_grid(vname, bound, size)
         y = np.empty(size, dtype=np.double)
         status = np.empty(size, dtype=bool)
 
         state = MnUserParameterState(self._last_state)  # copy
         ipar = self._var2pos[vname]
         state.fix(ipar)
-        for i, v in enumerate(x):
-            state.set_value(ipar, v)
-            migrad = MnMigrad(self._fcn, state, self.strategy)
-            fm = migrad(0, self._tolerance)
-            if not fm.is_valid:
+        self._fcn._clear_cache()
+        args = (self._fcn, state, self.strategy, self._tolerance, ipar)
+        if parallel:
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing as mp
+
+            # forked workers may deadlock if the cost function uses threads, e.g.
+            # from OpenMP or Numba, therefore we start fresh interpreters
+            ctx = mp.get_context("spawn")
+            with ProcessPoolExecutor(parallel, mp_context=ctx) as pool:
+                results = list(
+                    pool.map(_mnprofile_point, *zip(*(args + (v,) for v in x)))
+                )
+            # function calls in the workers do not update our counter
+            self._fcn._nfcn += sum(r[2] for r in results)
+        else:
+            results = _mnprofile_serial(*args, x)
+        for i, (v, (fval, valid, _)) in enumerate(zip(x, results)):
+            if not valid:
                 warnings.warn(
                     f"MIGRAD fails to converge for {vname}={v}", mutil.IMinuitWarning
                 )
-            status[i] = fm.is_valid
-            y[i] = fm.fval
+            status[i] = valid
+            y[i] = fval
 
         if subtract_min:
             y -= np.min(y)
@@ -1503,6 +1563,7 @@ class Minuit:
         size: int = 100,
         bound: Union[float, mutil.UserBound] = 2,
         subtract_min: bool = False,
+        threads: Optional[int] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         r"""
         Calculate 1D cost function profile over a range.
@@ -1523,6 +1584,11 @@ class Minuit:
             symmetrically around the minimum (Default: 2).
         subtract_min :
             If true, subtract offset so that smallest value is zero (Default: False).
+        threads :
+            If set to a positive number, evaluate the scan points in that many threads.
+            This only gives a speed-up if the cost function releases the GIL, for
+            example, if it is compiled with ``numba.njit(nogil=True)``, or if it is
+            compiled with ``numba.njit``, see Notes (Default: None).
 
         Returns
         -------
@@ -1531,19 +1597,24 @@ class Minuit:
         y : array of float
             Function values.
 
+        Notes
+        -----
+        If the cost function has an attribute ``batch``, which is a function that accepts
+        a 2D array of parameter values with one row per scan point and returns an array
+        of function values, it is called once instead of calling the cost function for
+        each scan point. If the cost function is compiled with ``numba.njit``, a loop
+        over the scan points is compiled and used in the same way. The loop runs in
+        parallel with Numba's threading layer if `threads` is set.
+
         See Also
         --------
         mnprofile
         """
-        bound = self._normalize_bound(vname, bound)
-
         ipar = self._var2pos[vname]
-        x = np.linspace(bound[0], bound[1], size, dtype=np.double)
-        y = np.empty(size, dtype=np.double)
-        values = np.array(self.values)
-        for i, vi in enumerate(x):
-            values[ipar] = vi
-            y[i] = self.fcn(values)
+        x = self._scan_grid(vname, bound, size)
+        values = np.tile(self._last_state.values, (size, 1))
+        values[:, ipar] = x
+        y = self._fcn_batch(values, threads)
 
         if subtract_min:
             y -= np.min(y)
@@ -1626,6 +1697,7 @@ class Minuit:
         size: int = 50,
         bound: Union[float, Tuple[Tuple[float, float], Tuple[float, float]]] = 2,
         subtract_min: bool = False,
+        threads: Optional[int] = None,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         r"""
         Get a 2D contour of the function around the minimum.
@@ -1655,6 +1727,9 @@ class Minuit:
             (Default: 2).
         subtract_min :
             Subtract minimum from return values (Default: False).
+        threads :
+            If set to a positive number, evaluate the grid points in that many threads,
+            see :meth:`profile` (Default: None).
 
         Returns
         -------
@@ -1663,33 +1738,34 @@ class Minuit:
         y : array of float
             Parameter values of second parameter.
         fval : 2D array of float
-            Function values.
+            Function values. The element ``fval[i, j]`` belongs to ``x[i]`` and ``y[j]``,
+            pass ``fval.T`` to :func:`matplotlib.pyplot.contour`.
+
+        Notes
+        -----
+        Like :meth:`profile`, this calls the ``batch`` attribute of the cost function
+        once for all grid points if it is available.
 
         See Also
         --------
         mncontour, mnprofile
         """
         if isinstance(bound, tuple):
-            xrange = self._normalize_bound(x, bound[0])
-            yrange = self._normalize_bound(y, bound[1])
+            xbound, ybound = bound
         else:
-            n = float(bound)
-            xrange = self._normalize_bound(x, n)
-            yrange = self._normalize_bound(y, n)
+            xbound = ybound = float(bound)
 
         ipar = self._var2pos[x]
         jpar = self._var2pos[y]
 
-        x = np.linspace(xrange[0], xrange[1], size)
-        y = np.linspace(yrange[0], yrange[1], size)
+        x = self._scan_grid(x, xbound, size)
+        y = self._scan_grid(y, ybound, size)
 
-        z = np.empty((size, size), dtype=np.double)
-        values = np.array(self.values)
-        for i, xi in enumerate(x):
-            values[ipar] = xi
-            for j, yi in enumerate(y):
-                values[jpar] = yi
-                z[i, j] = self._fcn(values)
+        xg, yg = np.meshgrid(x, y, indexing="ij")
+        values = np.tile(self._last_state.values, (size * size, 1))
+        values[:, ipar] = xg.ravel()
+        values[:, jpar] = yg.ravel()
+        z = self._fcn_batch(values, threads).reshape(size, size)
 
         if subtract_min:
             z -= np.min(z)
@@ -1720,7 +1796,8 @@ class Minuit:
 
         v = [self.errordef * (i + 1) for i in range(4)]
 
-        CS = plt.contour(vx, vy, vz, v)
+        # matplotlib expects vz[y, x], the transpose is a view
+        CS = plt.contour(vx, vy, vz.T, v)
         plt.clabel(CS, v)
         plt.xlabel(x)
         plt.ylabel(y)
@@ -1765,6 +1842,15 @@ class Minuit:
         See Also
         --------
         contour, mnprofile
+
+        Notes
+        -----
+        The result is cached for the current minimum. Repeated calls with the same
+        arguments return the cached contour until the minimum is updated, e.g. by
+        :meth:`migrad`, :meth:`hesse` or :meth:`reset`. If the cost function was
+        changed since the last minimisation, for example by setting new data, run
+        :meth:`migrad` again before calling this method, otherwise the cached contour
+        of the old minimum is returned.
         """
         if cl is None:
             factor = 2.27886856637673  # chi2(2).ppf(0.68)
@@ -1786,11 +1872,21 @@ class Minuit:
         if x not in vary or y not in vary:
             raise ValueError("mncontour cannot be run on fixed parameters.")
 
-        with TemporaryErrordef(self._fcn, factor):
-            mnc = MnContours(self._fcn, self._fmin._src, self.strategy)
-            ce = mnc(ix, iy, size)[2]
-
-        return np.array(ce)
+        # identical calls for the same minimum are answered from a cache; a new FMin
+        # object is created whenever the minimum is updated
+        cache = self._mncontour_cache
+        if cache is None or cache[0] is not self._fmin:
+            cache = self._mncontour_cache = (self._fmin, {})
+        key = (ix, iy, factor, size, self.strategy.strategy, self.errordef)
+        ce = cache[1].get(key)
+        if ce is None:
+            self._fcn._clear_cache()
+            with TemporaryErrordef(self._fcn, factor):
+                mnc = MnContours(self._fcn, self._fmin._src, self.strategy)
+                ce = mnc(ix, iy, size)[2]
+            cache[1][key] = ce
+
+        return ce.copy()
 
     def draw_mncontour(
         self, x: str, y: str, *, cl: Optional[Iterable[float]] = None, size: int = 100
@@ -1818,9 +1914,7 @@ class Minuit:
         c_pts = []
         for cl in cls:  # type:ignore
             pts = self.mncontour(x, y, cl=cl, size=size)
-            # close curve
-            pts = list(pts)
-            pts.append(pts[0])
+            pts = np.concatenate((pts, pts[:1]))  # close curve
             c_val.append(cl if cl is not None else 0.68)
             c_pts.append([pts])  # level can have more than one contour in mpl
         cs = ContourSet(plt.gca(), c_val, c_pts)
@@ -1830,8 +1924,8 @@ class Minuit:
 
         return cs
 
-    def _free_parameters(self) -> Generator[str, None, None]:
-        return (mp.name for mp in self._last_state if not mp.is_fixed)
+    def _free_parameters(self) -> Tuple[str, ...]:
+        return tuple(mp.name for mp in self._last_state if not mp.is_fixed)
 
     def _mnprecision(self) -> MnMachinePrecision:
         pr = MnMachinePrecision()
@@ -1839,20 +1933,21 @@ class Minuit:
             pr.eps = self._precision
         return pr
 
-    def _normalize_bound(
-        self, vname: str, bound: Union[float, mutil.UserBound]
-    ) -> Tuple[float, float]:
+    def _scan_grid(
+        self, vname: str, bound: Union[float, mutil.UserBound], size: int
+    ) -> np.ndarray:
         if isinstance(bound, Iterable):
-            return mutil._normalize_limit(bound)
-
-        if not self.accurate:
-            warnings.warn(
-                "Specified nsigma bound, but error matrix is not accurate",
-                mutil.IMinuitWarning,
-            )
-        start = self.values[vname]
-        sigma = self.errors[vname]
-        return (start - bound * sigma, start + bound * sigma)
+            low, high = mutil._normalize_limit(bound)
+        else:
+            if not self.accurate:
+                warnings.warn(
+                    "Specified nsigma bound, but error matrix is not accurate",
+                    mutil.IMinuitWarning,
+                )
+            p = self._last_state[self._var2pos[vname]]
+            low = p.value - bound * p.error
+            high = p.value + bound * p.error
+        return np.linspace(low, high, size, dtype=np.double)
 
     def _copy_state_if_needed(self):
         # If FunctionMinimum exists, _last_state may be a reference to its user state.
@@ -1863,34 +1958,84 @@ class Minuit:
         #
         # If FunctionMinimum does not exist, we don't want to copy. We want to
         # implicitly modify _init_state; _last_state is an alias for _init_state, then.
-        if self._fmin and self._last_state == self._fmin._src.state:
+        #
+        # An identity check suffices, since pybind11 returns the same Python object
+        # for the user state of the same FunctionMinimum.
+        if self._fmin and self._last_state is self._fmin._src.state:
             self._last_state = MnUserParameterState(self._last_state)
 
     def _make_covariance(self) -> None:
         if self._last_state.has_covariance:
-            cov = self._last_state.covariance
-            m = mutil.Matrix(self._var2pos)
-            n = len(m)
-            if cov.nrow < self.npar:
-                ext2int = {}
-                k = 0
-                for mp in self._last_state:
-                    if not mp.is_fixed:
-                        ext2int[mp.number] = k
-                        k += 1
-                m.fill(0)
-                for e, i in ext2int.items():
-                    for f, j in ext2int.items():
-                        m[e, f] = cov[i, j]
+            cov = self._last_state.covariance.to_numpy()
+            if len(cov) < self.npar:
+                # zeroed memory comes from calloc, no separate fill pass
+                m = np.zeros((self.npar, self.npar)).view(mutil.Matrix)
+                ext = [mp.number for mp in self._last_state if not mp.is_fixed]
+                m[np.ix_(ext, ext)] = cov
             else:
-                n = len(m)
-                for i in range(n):
-                    for j in range(n):
-                        m[i, j] = cov[i, j]
+                # no fixed parameters: use freshly allocated array without copying
+                m = cov.view(mutil.Matrix)
+            m._var2pos = self._var2pos
             self._covariance = m
         else:
             self._covariance = None
 
+    def _fcn_batch(self, x: np.ndarray, threads: Optional[int] = None) -> np.ndarray:
+        # evaluate cost function for each row of x, with one call if the cost function
+        # provides a vectorized version as attribute "batch"
+        fcn = self._fcn._fcn
+        batch = getattr(fcn, "batch", None)
+        if batch is None and hasattr(fcn, "py_func"):
+            # a parallel loop starts Numba's threading layer, which may conflict with
+            # other threads or forked processes, so it is only used when asked for
+            batch = _numba_batch(fcn, self._fcn._array_call, self.npar, bool(threads))
+            if batch is not None and threads:
+                import numba as nb
+
+                nthreads = nb.get_num_threads()
+                nb.set_num_threads(min(threads, nb.config.NUMBA_NUM_THREADS))
+                try:
+                    return self._check_batch(batch(x), x)
+                finally:
+                    nb.set_num_threads(nthreads)
+        if batch is not None:
+            return self._check_batch(batch(x), x)
+        if threads:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # FCN only touches its counters while holding the GIL, so this is safe
+            with ThreadPoolExecutor(threads) as pool:
+                return np.fromiter(
+                    pool.map(self._fcn, x), dtype=np.double, count=len(x)
+                )
+        return np.array([self._fcn(xi) for xi in x], dtype=np.double)
+
+    def _check_batch(self, y: Any, x: np.ndarray) -> np.ndarray:
+        # the batch bypasses FCN, so do here what FCN does for each call; the shape is
+        # checked, since a wrong result would otherwise only fail later in reshape
+        self._fcn._nfcn += len(x)
+        y = np.asarray(y, dtype=np.double)
+        if y.shape != (len(x),):
+            raise ValueError(f"batch result must have shape {(len(x),)}, got {y.shape}")
+        if self._fcn._throw_nan:
+            nan = np.isnan(y)
+            if np.any(nan):
+                xi = x[np.argmax(nan)]
+                raise RuntimeError(
+                    "result is NaN for [ " + "".join(f"{v:g} " for v in xi) + "]"
+                )
+        return y
+
+    def _migrad_fmin(self, fm: FunctionMinimum) -> mutil.FMin:
+        return mutil.FMin(
+            fm,
+            "Migrad",
+            self.nfcn,
+            self.ngrad,
+            self.ndof,
+            self._edm_goal(migrad_factor=True),
+        )
+
     def _edm_goal(self, migrad_factor=False) -> float:
         # EDM goal
         # - taken from the source code, see VariableMeticBuilder::Minimum and
@@ -1950,6 +2095,12 @@ class Minuit:
             p.text(str(self))
 
 
+@lru_cache(maxsize=None)
+def _default_names(n: int) -> Tuple[str, ...]:
+    # names for functions without signature, shared by all Minuit instances
+    return tuple(f"x{i}" for i in range(n))
+
+
 def _make_init_state(
     pos2var: Tuple[str, ...], args: np.ndarray, kwds: Dict[str, float]
 ) -> MnUserParameterState:
@@ -1962,8 +2113,9 @@ def _make_init_state(
                 f"parameter keyword arguments {kwds}"
             )
     else:
+        names = frozenset(pos2var)
         for kw in kwds:
-            if kw not in pos2var:
+            if kw not in names:
                 raise RuntimeError(
                     f"{kw} is not one of the parameters [{' '.join(pos2var)}]"
                 )
@@ -1982,12 +2134,116 @@ def _make_init_state(
     return state
 
 
+class _CFuncWrapper:
+    # Calls from Python, e.g. from the SciPy minimizers, go to the original function
+    # with its calling convention, while the C++ side finds the compiled shim through
+    # the ctypes attribute, see util._address_of_cfunc
+    __slots__ = ("_fcn", "_cfunc", "ctypes")
+
+    def __init__(self, fcn: Callable, cfunc: Any):
+        self._fcn = fcn
+        self._cfunc = cfunc  # keeps the compiled code alive
+        self.ctypes = cfunc.ctypes
+
+    def __call__(self, *args: Any) -> float:
+        return self._fcn(*args)
+
+
+def _make_cfunc(fcn: Callable, npar: int, array_call: bool) -> Any:
+    # Compile a shim with the signature double(uint32, double*) that the C++ side
+    # calls directly, see util._address_of_cfunc. Falls back to the original function
+    # if Numba is not available or cannot compile it.
+    try:
+        import numba as nb
+
+        jitted = fcn if hasattr(fcn, "py_func") else nb.njit(fcn)
+        if array_call:
+            code = "lambda n, par: fcn(carray(par, (n,)))"
+        else:
+            code = f"lambda n, par: fcn({', '.join(f'par[{i}]' for i in range(npar))})"
+        shim = eval(code, {"fcn": jitted, "carray": nb.carray})
+        sig = nb.types.double(nb.types.uintc, nb.types.CPointer(nb.types.double))
+        return _CFuncWrapper(fcn, nb.cfunc(sig)(shim))
+    except Exception as e:
+        warnings.warn(
+            f"jit compilation of cost function failed ({type(e).__name__}), using it as is",
+            mutil.IMinuitWarning,
+            stacklevel=3,
+        )
+        return fcn
+
+
+def _mnprofile_point(
+    fcn: FCN,
+    state: MnUserParameterState,
+    strategy: MnStrategy,
+    tolerance: float,
+    ipar: int,
+    value: float,
+) -> Tuple[float, bool, int]:
+    # module-level so that it can be used by worker processes in Minuit.mnprofile
+    nfcn = fcn._nfcn
+    state.set_value(ipar, value)
+    fm = MnMigrad(fcn, state, strategy)(0, tolerance)
+    return fm.fval, fm.is_valid, fcn._nfcn - nfcn
+
+
+def _mnprofile_serial(
+    fcn: FCN,
+    state: MnUserParameterState,
+    strategy: MnStrategy,
+    tolerance: float,
+    ipar: int,
+    values: np.ndarray,
+) -> Generator:
+    # MnMigrad keeps the last minimum as its state, so each point starts from the
+    # minimum of the previous point, which is usually close
+    migrad = MnMigrad(fcn, state, strategy)
+    for value in values:
+        migrad.set_value(ipar, value)
+        fm = migrad(0, tolerance)
+        yield fm.fval, fm.is_valid, 0
+        if not fm.is_valid:
+            # do not start the next point from a failed minimisation
+            migrad = MnMigrad(fcn, state, strategy)
+
+
+@lru_cache(maxsize=8)
+def _numba_batch(
+    fcn: Any, array_call: bool, npar: int, parallel: bool
+) -> Optional[Callable]:
+    # Compile a loop over the rows of a parameter matrix for a cost function that is
+    # already a Numba dispatcher. Returns None if that fails. The cache is bounded,
+    # since it keeps the cost functions and their compiled loops alive.
+    try:
+        import numba as nb
+
+        if array_call:
+            row = fcn
+        else:
+            args = ", ".join(f"x[{i}]" for i in range(npar))
+            row = nb.njit(eval(f"lambda x: fcn({args})", {"fcn": fcn}))
+
+        # explicit signature compiles immediately, so that failures are detected here
+        @nb.njit(nb.float64[:](nb.float64[:, :]), parallel=parallel)
+        def batch(x):  # pragma: no cover
+            r = np.empty(len(x))
+            # prange is a normal range if parallel is False
+            for i in nb.prange(len(x)):
+                r[i] = row(x[i])
+            return r
+
+        return batch
+    except Exception:
+        return None
+
+
 def _get_params(mps: MnUserParameterState, merrors: mutil.MErrors) -> mutil.Params:
     def get_me(name: str) -> Optional[Tuple[float, float]]:
-        if name in merrors:
-            me = merrors[name]
-            return me.lower, me.upper
-        return None
+        me = merrors.get(name)
+        if me is None:
+            return None
+        return me.lower, me.upper
 
     return mutil.Params(
         (
@@ -2009,12 +2265,16 @@ def _get_params(mps: MnUserParameterState, merrors: mutil.MErrors) -> mutil.Para
 
 class TemporaryErrordef:
     def __init__(self, fcn: FCN, factor: float):
-        self.saved = fcn._errordef
         self.fcn = fcn
-        self.fcn._errordef *= factor
+        self.saved = None
+        # common case factor == 1 (one standard deviation) needs no round-trip to FCN
+        if factor != 1:
+            self.saved = fcn._errordef
+            fcn._errordef = self.saved * factor
 
     def __enter__(self) -> None:
         pass
 
     def __exit__(self, *args: object) -> None:
-        self.fcn._errordef = self.saved
+        if self.saved is not None:
+            self.fcn._errordef = self.saved
@@ -82,6 +82,10 @@ class BasicView(abc.ABC):
     def _set(self, idx: int, value: Any) -> None:
         pass  # pragma: no cover
 
+    def _set_many(self, idx: List[int], values: Iterable) -> None:
+        for i, v in zip(idx, values):
+            self._set(i, v)
+
     def __getitem__(self, key: Key) -> Any:
         """
         Get values of the view.
@@ -92,6 +96,8 @@ class BasicView(abc.ABC):
             If the key is an int or str, return corresponding value.
             If it is a slice, list of int or str, return the corresponding subset.
         """
+        if isinstance(key, str):  # fast path for access by name
+            return self._get(self._minuit._var2pos[key])
         key = _key2index(self._minuit._var2pos, key)
         if isinstance(key, list):
             return [self._get(i) for i in key]
@@ -108,8 +114,7 @@ class BasicView(abc.ABC):
             else:
                 if len(value) != len(key):
                     raise ValueError("length of argument does not match slice")
-                for i, v in zip(key, value):
-                    self._set(i, v)
+                self._set_many(key, value)
         else:
             self._set(key, value)
 
@@ -118,7 +123,11 @@ class BasicView(abc.ABC):
         from typing import Iterable, Sized
 
         if isinstance(other, Iterable) and isinstance(other, Sized):
-            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+            if len(self) != len(other):
+                return False
+            if hasattr(self, "__array__"):  # numeric views support bulk reads
+                return np.array_equal(self, other)
+            return all(x == y for x, y in zip(self, other))
         return NotImplemented
 
     def __repr__(self) -> str:
@@ -155,9 +164,16 @@ class ValueView(BasicView):
     def _get(self, i: int) -> float:
         return self._minuit._last_state[i].value  # type:ignore
 
+    def __array__(self, dtype: Any = None) -> np.ndarray:
+        """Get values as numpy array in one call."""
+        return np.asarray(self._minuit._last_state.values, dtype=dtype)
+
     def _set(self, i: int, value: float) -> None:
         self._minuit._last_state.set_value(i, value)
 
+    def _set_many(self, idx: List[int], values: Iterable) -> None:
+        self._minuit._last_state.set_values(idx, values)
+
 
 class ErrorView(BasicView):
     """Array-like view of parameter errors."""
@@ -165,9 +181,16 @@ class ErrorView(BasicView):
     def _get(self, i: int) -> float:
         return self._minuit._last_state[i].error  # type:ignore
 
+    def __array__(self, dtype: Any = None) -> np.ndarray:
+        """Get errors as numpy array in one call."""
+        return np.asarray(self._minuit._last_state.errors, dtype=dtype)
+
     def _set(self, i: int, value: float) -> None:
         self._minuit._last_state.set_error(i, value)
 
+    def _set_many(self, idx: List[int], values: Iterable) -> None:
+        self._minuit._last_state.set_errors(idx, values)
+
 
 class FixedView(BasicView):
     """Array-like view of whether parameters are fixed."""
@@ -203,14 +226,16 @@ class LimitView(BasicView):
         # changing limits is a cheap operation, start from clean state
         state.remove_limits(i)
         low, high = _normalize_limit(arg)
-        if low != -np.inf and high != np.inf:  # both must be set
+        # bit 1: lower limit is set, bit 0: upper limit is set
+        mask = (low != -np.inf) * 2 + (high != np.inf)
+        if mask == 3:
             if low == high:
                 state.fix(i)
             else:
                 state.set_limits(i, low, high)
-        elif low != -np.inf:  # lower limit must be set
+        elif mask == 2:
             state.set_lower_limit(i, low)
-        elif high != np.inf:  # lower limit must be set
+        elif mask == 1:
             state.set_upper_limit(i, high)
         # bug in Minuit2: must set parameter value and error again after changing limits
         if val < low:
@@ -1263,6 +1288,10 @@ def _key2index_item(var2pos: Dict[str, int], key: Union[str, int]) -> int:
 def _key2index(
     var2pos: Dict[str, int], key: Union[slice, Iterable[Union[str, int]], str, int]
 ) -> Union[int, List[int]]:
+    # fast path for the common case of a single name or index
+    if isinstance(key, (str, int)):
+        return _key2index_item(var2pos, key)
+
     from typing import Iterable
 
     if isinstance(key, slice):
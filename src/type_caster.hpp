@@ -1,6 +1,8 @@
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <algorithm>
+#include <cstring>
+#include <type_traits>
 #include <vector>
 
 namespace pybind11 {
@@ -14,7 +16,7 @@ struct type_caster<std::vector<Value>> {
 
   bool load(handle src, bool convert) {
     value.clear();
-    // TODO optimize for python objects that support buffer protocol
+    if (load_array(src, convert, std::is_floating_point<Value>{})) return true;
     if (isinstance<iterable>(src)) {
       auto seq = reinterpret_borrow<iterable>(src);
       if (hasattr(seq, "__len__")) value.reserve(static_cast<std::size_t>(len(seq)));
@@ -28,6 +30,22 @@ struct type_caster<std::vector<Value>> {
     return false;
   }
 
+  bool load_array(handle, bool, std::false_type) { return false; }
+
+  // fast path for 1D numpy arrays: copy the buffer instead of converting each element
+  // to a Python scalar; arrays of other numeric dtypes are converted by numpy if
+  // allowed, but not arrays of strings, which numpy would parse
+  bool load_array(handle src, bool convert, std::true_type) {
+    if (!isinstance<array>(src)) return false;
+    if (!convert && !array_t<Value>::check_(src)) return false;
+    if (!std::strchr("biuf", reinterpret_borrow<array>(src).dtype().kind()))
+      return false;
+    auto arr = array_t<Value, array::c_style | array::forcecast>::ensure(src);
+    if (!arr || arr.ndim() != 1) return false;
+    value.assign(arr.data(), arr.data() + arr.size());
+    return true;
+  }
+
 public:
   template <typename T>
   static handle cast(T&& src, return_value_policy, handle) {
@@ -1,4 +1,5 @@
 #include <Minuit2/MnUserCovariance.h>
+#include <pybind11/numpy.h>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <vector>
@@ -22,6 +23,17 @@ MnUserCovariance init(py::sequence seq, unsigned n) {
   return MnUserCovariance{py::cast<std::vector<double>>(seq), n};
 }
 
+py::array_t<double> to_numpy(const MnUserCovariance& self) {
+  const auto n = static_cast<ssize_t>(self.Nrow());
+  py::array_t<double> a({n, n});
+  auto r = a.mutable_unchecked<2>();
+  // unpack triangular storage in one pass, mirroring each element
+  auto it = self.Data().begin();
+  for (ssize_t j = 0; j < n; ++j)
+    for (ssize_t i = 0; i <= j; ++i) r(i, j) = r(j, i) = *it++;
+  return a;
+}
+
 void bind_usercovariance(py::module m) {
   py::class_<MnUserCovariance>(m, "MnUserCovariance")
 
@@ -35,6 +47,8 @@ void bind_usercovariance(py::module m) {
 
       .def_property_readonly("nrow", &MnUserCovariance::Nrow)
 
+      .def("to_numpy", &to_numpy)
+
       .def(py::self == py::self)
 
       .def(py::pickle(
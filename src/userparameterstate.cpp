@@ -1,6 +1,7 @@
 #include <Minuit2/MnUserParameterState.h>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
+#include <stdexcept>
 #include <type_traits>
 #include "equal.hpp"
 #include "type_caster.hpp"
@@ -41,6 +42,29 @@ auto iter(const MnUserParameterState& self) {
                            self.MinuitParameters().end());
 }
 
+template <class F>
+void set_many(MnUserParameterState& self, const std::vector<unsigned>& idx,
+              const std::vector<double>& val, F f) {
+  if (idx.size() != val.size())
+    throw std::invalid_argument("length of argument does not match slice");
+  const unsigned n = static_cast<unsigned>(size(self));
+  for (unsigned i : idx)
+    if (i >= n) throw py::index_error();
+  for (std::size_t k = 0; k < idx.size(); ++k) (self.*f)(idx[k], val[k]);
+}
+
+void set_values(MnUserParameterState& self, const std::vector<unsigned>& idx,
+                const std::vector<double>& val) {
+  set_many(self, idx, val,
+           py::overload_cast<unsigned, double>(&MnUserParameterState::SetValue));
+}
+
+void set_errors(MnUserParameterState& self, const std::vector<unsigned>& idx,
+                const std::vector<double>& val) {
+  set_many(self, idx, val,
+           py::overload_cast<unsigned, double>(&MnUserParameterState::SetError));
+}
+
 py::object globalcc2py(const MnGlobalCorrelationCoeff& gcc) {
   if (gcc.IsValid()) return py::cast(gcc.GlobalCC());
   return py::cast(nullptr);
@@ -81,6 +105,8 @@ void bind_userparameterstate(py::module m) {
            py::overload_cast<unsigned, double>(&MnUserParameterState::SetValue))
       .def("set_error",
            py::overload_cast<unsigned, double>(&MnUserParameterState::SetError))
+      .def("set_values", set_values)
+      .def("set_errors", set_errors)
       .def("set_limits", py::overload_cast<unsigned, double, double>(
                              &MnUserParameterState::SetLimits))
       .def("set_upper_limit",
@@ -89,6 +115,8 @@ void bind_userparameterstate(py::module m) {
            py::overload_cast<unsigned, double>(&MnUserParameterState::SetLowerLimit))
       .def("remove_limits",
            py::overload_cast<unsigned>(&MnUserParameterState::RemoveLimits))
+      .def_property_readonly("values", &MnUserParameterState::Params)
+      .def_property_readonly("errors", &MnUserParameterState::Errors)
       .def_property_readonly("fval", &MnUserParameterState::Fval)
       .def_property_readonly("edm", &MnUserParameterState::Edm)
       .def_property_readonly("covariance", &MnUserParameterState::Covariance)
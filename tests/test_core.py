@@ -14,6 +14,8 @@ from iminuit._core import (
 from pytest import approx
 import pytest
 import pickle
+import numpy as np
+from numpy.testing import assert_equal
 
 
 @pytest.fixture
@@ -46,6 +48,8 @@ def test_MnUserCovariance():
     assert c[(0, 1)] == 2
     assert c[(1, 1)] == 3
 
+    assert c.to_numpy().tolist() == [[1, 2], [2, 3]]
+
     pkl = pickle.dumps(c)
     c2 = pickle.loads(pkl)
     assert c2.nrow == 2
@@ -77,6 +81,8 @@ def test_MnUserParameterState():
     assert st[1].error == 0.3
     assert st[1].lower_limit == 1
     assert st[1].upper_limit == 4
+    assert st.values.tolist() == [1, 3]
+    assert st.errors.tolist() == [0.2, 0.3]
 
     st2 = MnUserParameterState(st)
     assert st2 == st
@@ -85,6 +91,17 @@ def test_MnUserParameterState():
 
     assert st2 != st
 
+    st2.set_values([1, 0], [2.5, 0.5])
+    st2.set_errors([0], [0.4])
+    assert st2.values.tolist() == [0.5, 2.5]
+    assert st2.errors.tolist() == [0.4, 0.3]
+
+    with pytest.raises(ValueError):
+        st2.set_values([0, 1], [1])
+
+    with pytest.raises(IndexError):
+        st2.set_errors([2], [1])
+
 
 def test_MnMigrad():
     fcn = FCN(fn, None, False, 1)
@@ -102,6 +119,12 @@ def test_MnMigrad():
     assert fcn._nfcn > 0
     assert fcn._ngrad == 0
 
+    # next call starts from last minimum with modified value
+    migrad.set_value(0, 5)
+    fmin = migrad(0, 0.1)
+    assert fmin.is_valid
+    assert fmin.state[0].value == approx(0, abs=5e-3)
+
 
 def test_MnMigrad_grad():
     fcn = FCN(lambda x: 10 + x ** 2, lambda x: [2 * x], False, 1)
@@ -175,6 +198,21 @@ def test_MnMigrad_np():
     assert fcn._ngrad > 0
 
 
+@pytest.mark.parametrize("dtype", (np.float64, np.float32, np.int64))
+def test_FCN_grad_array(dtype):
+    fcn = FCN(lambda x: 0, lambda x: np.arange(3, dtype=dtype), True, 1)
+    assert_equal(fcn.gradient(np.zeros(3)), (0, 1, 2))
+    # non-contiguous array
+    fcn = FCN(lambda x: 0, lambda x: np.arange(6, dtype=dtype)[::2], True, 1)
+    assert_equal(fcn.gradient(np.zeros(3)), (0, 2, 4))
+
+
+def test_FCN_grad_array_of_strings():
+    fcn = FCN(lambda x: 0, lambda x: np.array(["0", "1"]), True, 1)
+    with pytest.raises(RuntimeError):
+        fcn.gradient(np.zeros(2))
+
+
 def test_MnScan():
     fcn = FCN(lambda x: 10 + x ** 2, None, False, 1)
     state = MnUserParameterState()
@@ -12,9 +12,18 @@ from iminuit.cost import (
     NormalConstraint,
     _log_poisson_part,
     _spd_transform,
+    _sum_log_x,
+    _sum_log_poisson,
+    _sum_log_poisson_part,
+    _sum_z_squared,
+    _sum_z_squared_soft_l1,
+    _quadratic_form,
     PerformanceWarning,
 )
 from collections.abc import Sequence
+import pickle
+import weakref
+import gc
 
 stats = pytest.importorskip("scipy.stats")
 norm = stats.norm
@@ -174,6 +183,24 @@ def test_weighted_ExtendedBinnedNLL():
     assert m2.errors[0] == pytest.approx(2 * m1.errors[0], rel=1e-2)
 
 
+@pytest.mark.parametrize("cls", (BinnedNLL, ExtendedBinnedNLL))
+def test_BinnedCost_n_modified_in_place(cls):
+    xe = np.array([0.0, 1.0, 2.0, 3.0])
+    n = np.array([1.0, 5.0, 2.0])
+    cost = cls(n.copy(), xe, lambda x, a: a * x)
+    assert_allclose(cost(8.0), cls(n, xe, lambda x, a: a * x)(8.0))
+    cost.n[1] = 3
+    n[1] = 3
+    assert_allclose(cost(8.0), cls(n, xe, lambda x, a: a * x)(8.0))
+    cost.n = (2, 2, 2)
+    assert_allclose(cost(8.0), cls([2, 2, 2], xe, lambda x, a: a * x)(8.0))
+
+    # float128 output uses the numpy implementation
+    ref = cls([2, 2, 2], xe, lambda x, a: (a * x).astype(np.float128))
+    cost.mask = ref.mask = (True, False, True)
+    assert_allclose(cost(8.0), float(ref(8.0)))
+
+
 def test_ExtendedBinnedNLL_bad_input():
     with pytest.raises(ValueError):
         ExtendedBinnedNLL([1], [1], lambda x, a: 0)
@@ -228,6 +255,9 @@ def test_UnbinnedNLL_mask():
     assert_equal(c.mask, (True, False, True))
     assert np.isnan(c(0)) == False
 
+    c.data = [1, 2, 3]
+    assert c(0) == pytest.approx(-2 * np.log(3))
+
 
 def test_UnbinnedNLL_properties():
     def pdf(x, a, b):
@@ -277,6 +307,10 @@ def test_BinnedNLL_mask():
     assert c(1) < c_unmasked
     assert c.ndata == 2
 
+    c_masked = c(1)
+    c.n = [5, 1000, 10]
+    assert c(1) != c_masked
+
 
 def test_BinnedNLL_properties():
     def cdf(x, a, b):
@@ -308,6 +342,16 @@ def test_ExtendedBinnedNLL_mask():
     assert c.ndata == 2
 
 
+def test_ExtendedBinnedNLL_mask_weighted():
+    n = np.array([[5.0, 6.0], [1000.0, 1100.0], [1.0, 2.0], [3.0, 3.0]])
+    xe = np.array([0, 1, 2, 3, 4])
+    ma = np.array([True, False, False, True])
+    c = ExtendedBinnedNLL(n, xe, expon_cdf)
+    c.mask = ma
+    mu = np.diff(expon_cdf(xe, 2))[ma]
+    assert c(2) == pytest.approx(2 * _sum_log_poisson(n[ma], mu))
+
+
 def test_ExtendedBinnedNLL_properties():
     def cdf(x, a):
         return 0
@@ -335,6 +379,61 @@ def test_LeastSquares_mask():
     assert m.valid
     assert_equal(m.values, [1.5])
 
+    # setting data updates the masked data
+    c.y = [4, np.nan, 5]
+    c.yerror = [2, 2, 2]
+    assert c(0) == pytest.approx(((4 - 1) ** 2 + (5 - 3) ** 2) / 4)
+    c.x = [2, 2, 4]
+    assert c(0) == pytest.approx(((4 - 2) ** 2 + (5 - 4) ** 2) / 4)
+
+
+def test_LeastSquares_float32():
+    x = np.linspace(0, 1, 100)
+    y = 2 * x + 1
+
+    def model(x, a, b):
+        return a + b * x
+
+    c64 = LeastSquares(x, y, 0.1, model)
+    c32 = LeastSquares(x.astype(np.float32), y.astype(np.float32), 0.1, model)
+    assert c32.yerror.dtype == np.float32
+    assert c32(1.5, 2.5) == pytest.approx(c64(1.5, 2.5), rel=1e-5)
+
+
+def test_LeastSquares_strided_input():
+    xy = np.arange(20.0).reshape(10, 2)
+    x = xy[:, 0]
+    y = xy[:, 1]
+    assert not x.flags.c_contiguous
+
+    def model(x, a):
+        return x + a
+
+    c = LeastSquares(x, y, 1, model)
+    assert c.x.flags.c_contiguous
+    assert c.y.flags.c_contiguous
+    assert_equal(c.x, x)
+    assert c(1) == 0
+
+
+def test_LeastSquares_model_not_kept_alive():
+    def make_model(offset):
+        def model(x, a):
+            return a + offset
+
+        return model
+
+    model = make_model(1)
+    c = LeastSquares(1, 2, 3, model)
+    assert c.func_code.co_varnames == ("a",)
+    # cached parameter names are checked against __code__
+    model.__code__ = model.__code__.replace(co_varnames=("x", "b"))
+    assert LeastSquares(1, 2, 3, model).func_code.co_varnames == ("b",)
+    ref = weakref.ref(model)
+    del c, model
+    gc.collect()
+    assert ref() is None
+
 
 def test_LeastSquares_properties():
     def model(x, a):
@@ -440,6 +539,51 @@ def test_addable_cost_3():
     assert cs((1, 1)) == pytest.approx(4.5)
 
 
+def test_addable_cost_pickle():
+    # constituents with one, two, and no parameters
+    cs = (
+        NormalConstraint("a", 1, 2)
+        + NormalConstraint(("b", "a"), (1, 1), (2, 2))
+        + NormalConstraint("b", 2, 1)
+        + 1.5
+    )
+    cs2 = pickle.loads(pickle.dumps(cs))
+    assert cs2.func_code.co_varnames == ("a", "b")
+    assert cs2(1, 2) == cs(1, 2)
+
+
+def test_addable_cost_threads():
+    def model1(x, a):
+        return a + x
+
+    def model2(x, b, a):
+        return a + b * x
+
+    lsq1 = LeastSquares([1, 2], [2, 3], 3, model1)
+    lsq2 = LeastSquares([1, 2], [3, 5], 4, model2)
+    cs = 1.5 + lsq1 + lsq2
+    assert cs.threads == 0
+    ref = cs(1, 2)
+
+    cs.threads = 2
+    assert cs.threads == 2
+    with pytest.raises(ValueError):
+        cs.threads = -1
+    assert cs.threads == 2
+    assert cs(1, 2) == ref
+
+    m = Minuit(cs, a=0, b=0)
+    m.migrad()
+    assert m.valid
+
+    # the thread pool is not part of the state, so that CostSum can be pickled
+    cs = NormalConstraint("a", 1, 2) + NormalConstraint(("b", "a"), (1, 1), (2, 2))
+    cs.threads = 2
+    cs2 = pickle.loads(pickle.dumps(cs))
+    assert cs2.threads == 2
+    assert cs2(1, 2) == cs(1, 2)
+
+
 def test_NormalConstraint_1():
     def model(x, a):
         return a * np.ones_like(x)
@@ -521,6 +665,44 @@ def test_log_poisson_part():
     assert_allclose(_log_poisson_part(n, 1), 0)
 
 
+def test_sum_z_squared():
+    rng = np.random.default_rng(1)
+    y, ye, ym = rng.normal(size=(3, 1000))
+    ye = 1 + ye ** 2
+    z = (y - ym) / ye
+    assert_allclose(_sum_z_squared(y, ye, ym), np.sum(z ** 2))
+    assert_allclose(
+        _sum_z_squared_soft_l1(y, ye, ym), np.sum(2 * (np.sqrt(1 + z ** 2) - 1))
+    )
+    # model output which broadcasts
+    assert_allclose(_sum_z_squared(y, ye, ym[:1]), np.sum(((y - ym[0]) / ye) ** 2))
+
+
+def test_quadratic_form():
+    rng = np.random.default_rng(1)
+    value, x, var = rng.normal(size=(3, 5))
+    var = 1 + var ** 2
+    a = rng.normal(size=(5, 5))
+    covinv = a @ a.T
+    assert_allclose(_quadratic_form(value, x, 1 / var), np.sum((value - x) ** 2 / var))
+    assert_allclose(
+        _quadratic_form(value, x, covinv), (value - x) @ covinv @ (value - x)
+    )
+
+
+def test_sum_log_poisson():
+    rng = np.random.default_rng(1)
+    n = rng.poisson(5, size=1000).astype(float)
+    mu = rng.uniform(1, 10, size=1000)
+    part = n * (np.log(n + 1e-323) - np.log(mu))
+    assert_allclose(_sum_log_x(mu), np.sum(np.log(mu)))
+    assert_allclose(_sum_log_poisson_part(n, mu), np.sum(part))
+    assert_allclose(_sum_log_poisson(n, mu), np.sum(mu - n + part))
+    # weighted data
+    w = np.transpose((n, n))
+    assert_allclose(_sum_log_poisson(w, mu), _sum_log_poisson(*_spd_transform(w, mu)))
+
+
 def test_model_float128():
     def model(x, a):
         x = x.astype(np.float128)
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from iminuit import Minuit
 
 mpl = pytest.importorskip("matplotlib")
@@ -47,3 +48,18 @@ def test_drawcontour(minuit):
     minuit.draw_contour("x", "y")
     minuit.draw_contour("x", "x", size=20, bound=2)
     minuit.draw_contour("x", "x", size=20, bound=((-10, 10), (-10, 10)))
+
+
+def test_drawcontour_orientation():
+    from matplotlib import pyplot as plt
+
+    m = Minuit(f1, x=0, y=0)
+    m.migrad()
+    plt.figure()
+    m.draw_contour("x", "y", bound=((-4, 6), (-4, 6)))
+    xy = np.concatenate(
+        [p.vertices for c in plt.gca().collections for p in c.get_paths()]
+    )
+    # f1 is ten times narrower in y than in x
+    assert np.ptp(xy[:, 0]) > 5 * np.ptp(xy[:, 1])
+    plt.close()
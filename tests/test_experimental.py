@@ -1,4 +1,6 @@
-from iminuit import util, experimental
+from iminuit import util, experimental, Minuit
+import numpy as np
+import pytest
 
 
 def test_expanded():
@@ -13,3 +15,35 @@ def test_expanded():
     assert f(1, 2, 3) + g(1, 4, 5) == f2(1, 2, 3, 4, 5) + g2(1, 2, 3, 4, 5)
     assert util.describe(f2) == ["x", "y", "z", "a", "b"]
     assert util.describe(g2) == ["x", "y", "z", "a", "b"]
+
+
+def test_parallel_sum():
+    nb = pytest.importorskip("numba")
+
+    @nb.njit
+    def lsq(x, a, b):
+        return np.sum((x - a) ** 2 / b)
+
+    x = np.linspace(0, 1, 1001)
+
+    for nchunks in (None, 1, 3, 8):
+        cost = experimental.parallel_sum(lsq, x, nchunks=nchunks)
+        assert util.describe(cost) == ["a", "b"]
+        assert cost(0.5, 2.0) == pytest.approx(lsq(x, 0.5, 2.0))
+
+    # the number of chunks is a runtime argument, the reducer is compiled only once
+    assert len(experimental._chunked_reducer(lsq).signatures) == 1
+
+    with pytest.raises(ValueError):
+        experimental.parallel_sum(lsq, x, nchunks=0)
+
+    # more chunks than data points
+    cost3 = experimental.parallel_sum(lsq, x[:3], nchunks=8)
+    assert cost3(0.5, 2.0) == pytest.approx(lsq(x[:3], 0.5, 2.0))
+
+    cost.errordef = Minuit.LEAST_SQUARES
+    m = Minuit(cost, a=0, b=1)
+    m.fixed["b"] = True
+    m.migrad()
+    assert m.valid
+    assert m.values["a"] == pytest.approx(0.5)
@@ -135,33 +135,6 @@ def func_np_grad(x):  # test numpy support
     return 2 * (x - 1)
 
 
-data_y = [
-    0.552,
-    0.735,
-    0.846,
-    0.875,
-    1.059,
-    1.675,
-    1.622,
-    2.928,
-    3.372,
-    2.377,
-    4.307,
-    2.784,
-    3.328,
-    2.143,
-    1.402,
-    1.44,
-    1.313,
-    1.682,
-    0.886,
-    0.0,
-    0.266,
-    0.3,
-]
-data_x = list(range(len(data_y)))
-
-
 def func_test_helper(f, grad=None, errordef=None):
     m = Minuit(f, x=0, y=0, grad=grad)
     if errordef:
@@ -220,6 +193,10 @@ def test_no_signature():
     assert_allclose((val["x"], val["y"], m.fval), (1, 2, 0), atol=1e-8)
     assert m.valid
 
+    m = Minuit(no_signature, x=1, y=2, name=(n for n in "xy"))
+    assert m.parameters == ("x", "y")
+    assert m.values["y"] == 2
+
     with pytest.raises(RuntimeError):
         Minuit(no_signature, x=1)
 
@@ -335,6 +312,17 @@ def test_reset():
     assert m.ngrad == k
 
 
+def test_views_are_cached():
+    m = Minuit(func0, x=0, y=0)
+    assert m.values is m.values
+    assert m.errors is m.errors
+    assert m.fixed is m.fixed
+    assert m.limits is m.limits
+    assert m.merrors is m.merrors
+    m.values = (1, 2)
+    assert_equal(m.values, (1, 2))
+
+
 def test_typo():
     with pytest.raises(RuntimeError):
         Minuit(lambda x: 0, y=1)
@@ -632,6 +620,18 @@ def test_mnprofile(grad):
         m.mnprofile("foo")
 
 
+def test_mnprofile_parallel():
+    m = Minuit(func0, x=1.0, y=2.0)
+    m.migrad()
+    x, y, status = m.mnprofile("y", size=5)
+    nfcn = m.nfcn
+    x2, y2, status2 = m.mnprofile("y", size=5, parallel=2)
+    assert_equal(x2, x)
+    assert_allclose(y2, y)
+    assert_equal(status2, status)
+    assert m.nfcn > nfcn
+
+
 def test_mnprofile_subtract():
     m = Minuit(func0, x=1.0, y=2.0)
     m.migrad()
@@ -650,6 +650,105 @@ def test_contour_subtract():
     m.contour("x", "y", subtract_min=True)
 
 
+def test_profile_and_contour_batch():
+    def fcn(x, y):
+        return (x - 1) ** 2 + (y - 2) ** 2 + x * y
+
+    batch_calls = []
+
+    def batch(v):
+        batch_calls.append(v.shape)
+        return fcn(v[:, 0], v[:, 1])
+
+    fcn.errordef = 1
+
+    m = Minuit(fcn, x=1, y=2)
+    m.migrad()
+    x, y = m.profile("y", size=10)
+    z = m.contour("x", "y", size=5)
+    assert_allclose(z[2], fcn(z[0][:, np.newaxis], z[1]))
+
+    fcn.batch = batch
+    nfcn = m.nfcn
+    x2, y2 = m.profile("y", size=10)
+    z2 = m.contour("x", "y", size=5)
+    assert batch_calls == [(10, 2), (25, 2)]
+    assert m.nfcn == nfcn + 35
+    assert_allclose(x2, x)
+    assert_allclose(y2, y)
+    for a, b in zip(z2, z):
+        assert_allclose(a, b)
+
+    m.throw_nan = True
+    fcn.batch = lambda v: np.where(v[:, 1] > 2, np.nan, batch(v))
+    with pytest.raises(RuntimeError, match="result is NaN"):
+        m.profile("y", size=10)
+
+    fcn.batch = lambda v: batch(v)[1:]
+    with pytest.raises(ValueError, match=r"shape \(10,\)"):
+        m.profile("y", size=10)
+
+
+def test_profile_and_contour_threads():
+    m = Minuit(func0, x=1.0, y=2.0)
+    m.migrad()
+    nfcn = m.nfcn
+    x, y = m.profile("y", size=10)
+    x2, y2 = m.profile("y", size=10, threads=2)
+    assert_equal(x2, x)
+    assert_equal(y2, y)
+    z = m.contour("x", "y", size=5)
+    z2 = m.contour("x", "y", size=5, threads=3)
+    for a, b in zip(z2, z):
+        assert_equal(a, b)
+    assert m.nfcn == nfcn + 2 * (10 + 25)
+
+
+def test_profile_and_contour_numba():
+    nb = pytest.importorskip("numba")
+
+    def fcn(x, y):
+        return (x - 1) ** 2 + (y - 2) ** 2 + x * y
+
+    fcn_nb = nb.njit(fcn)
+    fcn_nb.errordef = 1
+
+    def fcn_np(par):
+        return fcn_nb(par[0], par[1])
+
+    fcn_np_nb = nb.njit(fcn_np)
+    fcn_np_nb.errordef = 1
+
+    for f, start in ((fcn_nb, (1, 2)), (fcn_np_nb, ((1, 2),))):
+        for threads in (None, 2):
+            m = Minuit(f, *start)
+            m.migrad()
+            nfcn = m.nfcn
+            x, y = m.profile(m.parameters[1], size=10, threads=threads)
+            z = m.contour(*m.parameters, size=5, threads=threads)
+            assert m.nfcn == nfcn + 35
+            assert_allclose(y, [fcn(*m.values[:1], yi) for yi in x])
+            assert_allclose(z[2], fcn(z[0][:, np.newaxis], z[1]))
+
+
+def test_profile_and_contour_numba_throw_nan():
+    nb = pytest.importorskip("numba")
+
+    @nb.njit
+    def fcn(x, y):
+        return np.nan if x > 1.5 else x ** 2 + y ** 2
+
+    fcn.errordef = 1
+    m = Minuit(fcn, 0, 0)
+    m.throw_nan = True
+    for threads in (None, 2):
+        with pytest.raises(RuntimeError, match=r"result is NaN for \[ 1.51515 0 \]"):
+            m.profile("x", bound=(0, 3), threads=threads)
+    m.throw_nan = False
+    x, y = m.profile("x", bound=(0, 3))
+    assert np.all(np.isnan(y[x > 1.5]))
+
+
 def test_mncontour_no_fmin():
     m = Minuit(lambda x, y: 0, x=0, y=0)
     m.errordef = 1
@@ -666,6 +765,33 @@ def test_mncontour_with_fixed_var():
         m.mncontour("x", "y")
 
 
+def test_mncontour_reversed_order():
+    m = Minuit(func0, x=1.0, y=2.0)
+    m.migrad()
+    ctr = m.mncontour("y", "x", size=10)
+    assert ctr.shape == (10, 2)
+    ctr2 = m.mncontour("x", "y", size=10)
+    assert_allclose(np.min(ctr, axis=0)[::-1], np.min(ctr2, axis=0), rtol=1e-3)
+    assert_allclose(np.max(ctr, axis=0)[::-1], np.max(ctr2, axis=0), rtol=1e-3)
+
+
+def test_mncontour_cache():
+    m = Minuit(func0, x=1.0, y=2.0)
+    m.migrad()
+    ctr = m.mncontour("x", "y", size=10)
+    nfcn = m.nfcn
+    ctr[:] = 0
+    ctr2 = m.mncontour("x", "y", size=10)
+    assert m.nfcn == nfcn
+    assert np.all(ctr2 != 0)
+    m.mncontour("x", "y", size=10, cl=0.9)
+    assert m.nfcn > nfcn
+    m.hesse()
+    nfcn = m.nfcn
+    assert_allclose(m.mncontour("x", "y", size=10), ctr2)
+    assert m.nfcn > nfcn
+
+
 def test_mncontour_array_func():
     stats = pytest.importorskip("scipy.stats")
 
@@ -898,6 +1024,33 @@ def test_migrad_ncall():
     assert m.nfcn < ncalls_without_limit
 
 
+def test_fcn_cache():
+    class Func:
+        errordef = 1
+        offset = 0
+
+        def __init__(self):
+            self.x = []
+
+        def __call__(self, a, b):
+            self.x.append((a, b))
+            return (a - 1) ** 2 + (b - 2) ** 2 + a * b + self.offset
+
+    fcn = Func()
+    m = Minuit(fcn, a=0, b=0)
+    m.migrad()
+    assert m.nfcn == len(fcn.x)
+    # repeated evaluations at the same point are skipped
+    assert len(fcn.x) == len(set(fcn.x))
+
+    # function may change between calls, cache must not return stale values
+    fval = m.fcn(m.values)
+    fcn.offset = 1
+    assert m.fcn(m.values) == fval + 1
+    m.migrad()
+    assert m.fval == approx(fval + 1)
+
+
 def test_ngrad():
     class Func:
         errordef = 1
@@ -1216,6 +1369,24 @@ def test_inaccurate_fcn(iterate, valid):
     assert m.valid == valid
 
 
+def test_migrad_callback():
+    def f(x):
+        return abs(x) ** 10 + 1e7
+
+    fmins = []
+    m = Minuit(f, x=2)
+    m.errordef = 1
+    m.migrad(callback=lambda fmin: fmins.append(fmin))
+    assert m.valid
+    assert len(fmins) > 1
+    assert not fmins[0].is_valid
+    assert fmins[-1] == m.fmin
+
+    m.reset()
+    m.migrad(callback=lambda fmin: True)
+    assert not m.valid
+
+
 def test_migrad_iterate():
     m = Minuit(lambda x: 0, x=2)
     m.errordef = 1
@@ -1367,6 +1538,63 @@ def test_cfunc():
     assert_allclose(m.values, (0, 1, 2), atol=1e-8)
 
 
+def test_jit():
+    pytest.importorskip("numba")
+
+    def fcn(a, b):
+        return (a - 1) ** 2 + (b - 2) ** 2
+
+    def fcn_np(x):
+        return np.sum((x - np.arange(3)) ** 2)
+
+    def fcn_bad(a, b):
+        return {}[a]
+
+    for f, start, expected in (
+        (fcn, (0, 0), (1, 2)),
+        (fcn_np, ((1, 2, 3),), (0, 1, 2)),
+    ):
+        m = Minuit(f, *start, jit=True)
+        assert m.fcn._fcn is not f
+        m.errordef = 1
+        m.migrad()
+        assert m.valid
+        assert_allclose(m.values, expected, atol=1e-8)
+
+    with pytest.warns(IMinuitWarning, match="jit compilation"):
+        m = Minuit(fcn_bad, 0, 0, jit=True)
+    assert m.fcn._fcn is fcn_bad
+
+
+def test_jit_grad():
+    pytest.importorskip("numba")
+
+    def fcn(a, b):
+        return (a - 1) ** 2 + (b - 2) ** 2
+
+    def grad(a, b):
+        return 2 * (a - 1), 2 * (b - 2)
+
+    def fcn_np(x):
+        return np.sum((x - np.arange(2)) ** 2)
+
+    def grad_np(x):
+        return 2 * (x - np.arange(2))
+
+    for f, g, start, expected in (
+        (fcn, grad, (0, 0), (1, 2)),
+        (fcn_np, grad_np, ((1, 2),), (0, 1)),
+    ):
+        m = Minuit(f, *start, grad=g, jit=True)
+        m.errordef = 1
+        m.migrad()
+        assert m.valid
+        assert m.ngrad > 0
+        assert_allclose(m.values, expected, atol=1e-8)
+        # calls from Python use the calling convention of the original function
+        assert m.fcn._fcn(*start) == f(*start)
+
+
 @pytest.mark.parametrize("cl", (0.5, None, 0.9))
 def test_confidence_level(cl):
     stats = pytest.importorskip("scipy.stats")
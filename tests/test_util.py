@@ -74,6 +74,10 @@ def test_ValueView():
     v[["x", "z"]] = (3, 1)
     assert_equal(v, (3, 2, 1))
 
+    a = np.array(v)
+    assert a.dtype == np.float64
+    assert_equal(a, (3, 2, 1))
+
 
 def test_Matrix():
     m = util.Matrix(("a", "b"))